@@ -8,8 +8,10 @@ for extracurricular activities at Mergington High School.
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
+from pydantic import BaseModel
 import os
 from pathlib import Path
+from urllib.parse import unquote
 
 app = FastAPI(title="Mergington High School API",
               description="API for viewing and signing up for extracurricular activities")
@@ -126,4 +128,41 @@ def unregister_from_activity(activity_name: str, email: str):
 
     # Remove student
     activity["participants"].remove(email)
-    return {"message": f"Unregistered {email} from {activity_name}"}
\ No newline at end of file
+    return {"message": f"Unregistered {email} from {activity_name}"}
+
+
+class BatchOperation(BaseModel):
+    path: str
+    email: str
+
+
+class BatchRequest(BaseModel):
+    ops: list[BatchOperation]
+
+
+# Actions that can be run through the batch endpoint
+batch_actions = {
+    "signup": signup_for_activity,
+    "unregister": unregister_from_activity,
+}
+
+
+@app.post("/activities/batch")
+def batch_activities(batch: BatchRequest):
+    """Run several signup/unregister operations in order in one request"""
+    results = []
+    for op in batch.ops:
+        # Expect paths of the form /activities/{activity_name}/{action}
+        parts = op.path.strip("/").split("/")
+        if len(parts) != 3 or parts[0] != "activities" or parts[2] not in batch_actions:
+            results.append({"path": op.path, "status_code": 404, "detail": "Operation not found"})
+            continue
+
+        # Report each operation's outcome without aborting the rest
+        try:
+            result = batch_actions[parts[2]](unquote(parts[1]), op.email)
+        except HTTPException as exc:
+            results.append({"path": op.path, "status_code": exc.status_code, "detail": exc.detail})
+        else:
+            results.append({"path": op.path, "status_code": 200, **result})
+    return results
@@ -1,53 +1,81 @@
 """
 Test configuration and fixtures for FastAPI tests.
 """
+import copy
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app
+from src.app import activities as _activities, app
+
+# Built once at import and shared by the sample_activities fixture
+_SAMPLE_ACTIVITIES = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    }
+}
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+@pytest.fixture(scope="session")
+async def client():
+    """Create a single async test client for the FastAPI app, shared by the session."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test",
+                                 follow_redirects=True) as c:
+        yield c
 
 
 @pytest.fixture
 def sample_activities():
-    """Sample activities data for testing."""
-    return {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        }
-    }
+    """Sample activities data for testing (shared by all tests, do not mutate)."""
+    return _SAMPLE_ACTIVITIES
 
 
-@pytest.fixture
-def reset_activities():
+@pytest.fixture(scope="session")
+def _pristine_activities():
+    """Deep copy of the activities database taken once per session."""
+    return copy.deepcopy(_activities)
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(_pristine_activities):
     """Reset activities to initial state after each test."""
-    from src.app import activities
-    
-    # Store original state
-    original_activities = {}
-    for name, activity in activities.items():
-        original_activities[name] = {
-            "description": activity["description"],
-            "schedule": activity["schedule"],
-            "max_participants": activity["max_participants"],
-            "participants": activity["participants"].copy()
-        }
-    
     yield
-    
-    # Restore original state
-    activities.clear()
-    activities.update(original_activities)
\ No newline at end of file
+
+    # Restore original state, copying only the participant lists tests mutate
+    _activities.clear()
+    _activities.update({
+        name: {**activity, "participants": list(activity["participants"])}
+        for name, activity in _pristine_activities.items()
+    })
+
+
+@pytest.fixture(scope="session")
+async def initial_activities_snapshot(client):
+    """Activities as returned by GET /activities before any test mutates them."""
+    response = await client.get("/activities")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture
+def fetch_activities(client):
+    """Fetch GET /activities at most once per test and reuse the decoded data."""
+    cache = {}
+
+    async def _get():
+        if "activities" not in cache:
+            response = await client.get("/activities")
+            assert response.status_code == 200
+            cache["activities"] = response.json()
+        return cache["activities"]
+
+    return _get
@@ -1,248 +1,277 @@
 """
 Tests for the Mergington High School Activities API.
 """
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
+from src.app import activities
+
+_ACTIVITY_NAMES = list(activities.keys())
+
+# Activity names and emails shared across tests
+CHESS_CLUB = "Chess Club"
+PROGRAMMING_CLASS = "Programming Class"
+MICHAEL = "michael@mergington.edu"
+
+# Endpoint URLs used across tests, parsed once at import
+CHESS_SIGNUP = httpx.URL(f"/activities/{CHESS_CLUB}/signup")
+CHESS_UNREGISTER = httpx.URL(f"/activities/{CHESS_CLUB}/unregister")
+PROGRAMMING_SIGNUP = httpx.URL(f"/activities/{PROGRAMMING_CLASS}/signup")
+PROGRAMMING_UNREGISTER = httpx.URL(f"/activities/{PROGRAMMING_CLASS}/unregister")
 
 
 class TestActivitiesAPI:
     """Test class for activities API endpoints."""
     
-    def setup_method(self):
-        """Setup method run before each test."""
-        self.client = TestClient(app)
-    
-    def test_root_redirect(self):
+    async def test_root_redirect(self, client):
         """Test that root path redirects to static/index.html."""
-        response = self.client.get("/")
+        response = await client.get("/")
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
     
-    def test_get_activities_success(self):
+    async def test_get_activities_success(self, fetch_activities):
         """Test successful retrieval of activities."""
-        response = self.client.get("/activities")
-        assert response.status_code == 200
-        
-        data = response.json()
+        data = await fetch_activities()
         assert isinstance(data, dict)
         assert len(data) > 0
         
         # Check structure of first activity
-        first_activity = list(data.values())[0]
+        first_activity = next(iter(data.values()))
         assert "description" in first_activity
         assert "schedule" in first_activity
         assert "max_participants" in first_activity
         assert "participants" in first_activity
         assert isinstance(first_activity["participants"], list)
     
-    def test_signup_for_activity_success(self):
+    async def test_fetch_activities_reuses_response(self, client, fetch_activities, monkeypatch):
+        """Test that repeated reads within a test send a single request."""
+        calls = []
+        original_get = client.get
+
+        async def counting_get(*args, **kwargs):
+            calls.append(args)
+            return await original_get(*args, **kwargs)
+
+        monkeypatch.setattr(client, "get", counting_get)
+        
+        first = await fetch_activities()
+        second = await fetch_activities()
+        assert second is first
+        assert calls == [("/activities",)]
+    
+    async def test_signup_for_activity_success(self, client, initial_activities_snapshot):
         """Test successful signup for an activity."""
         # Get initial participant count
-        initial_response = self.client.get("/activities")
-        initial_data = initial_response.json()
-        chess_club = initial_data["Chess Club"]
+        chess_club = initial_activities_snapshot[CHESS_CLUB]
         initial_count = len(chess_club["participants"])
         
         # Sign up new student
-        response = self.client.post(
-            "/activities/Chess Club/signup?email=newstudent@mergington.edu"
+        response = await client.post(
+            CHESS_SIGNUP, params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
         
         data = response.json()
         assert "message" in data
         assert "newstudent@mergington.edu" in data["message"]
-        assert "Chess Club" in data["message"]
+        assert CHESS_CLUB in data["message"]
         
         # Verify participant was added
-        updated_response = self.client.get("/activities")
-        updated_data = updated_response.json()
-        updated_chess_club = updated_data["Chess Club"]
+        updated_chess_club = activities[CHESS_CLUB]
         assert len(updated_chess_club["participants"]) == initial_count + 1
         assert "newstudent@mergington.edu" in updated_chess_club["participants"]
     
-    def test_signup_for_nonexistent_activity(self):
+    async def test_signup_for_nonexistent_activity(self, client):
         """Test signup for non-existent activity returns 404."""
-        response = self.client.post(
-            "/activities/Nonexistent Activity/signup?email=student@mergington.edu"
+        response = await client.post(
+            "/activities/Nonexistent Activity/signup", params={"email": "student@mergington.edu"}
         )
         assert response.status_code == 404
         
-        data = response.json()
-        assert data["detail"] == "Activity not found"
+        assert b'"detail":"Activity not found"' in response.content
     
-    def test_signup_duplicate_registration(self):
+    async def test_signup_duplicate_registration(self, client):
         """Test that duplicate registration returns 400."""
         # Try to register existing student
-        response = self.client.post(
-            "/activities/Chess Club/signup?email=michael@mergington.edu"
+        response = await client.post(
+            CHESS_SIGNUP, params={"email": MICHAEL}
         )
         assert response.status_code == 400
         
-        data = response.json()
-        assert data["detail"] == "Student already signed up"
+        assert b'"detail":"Student already signed up"' in response.content
     
-    def test_unregister_from_activity_success(self):
+    async def test_unregister_from_activity_success(self, client, initial_activities_snapshot):
         """Test successful unregistration from an activity."""
         # Get initial participant count
-        initial_response = self.client.get("/activities")
-        initial_data = initial_response.json()
-        chess_club = initial_data["Chess Club"]
+        chess_club = initial_activities_snapshot[CHESS_CLUB]
         initial_count = len(chess_club["participants"])
         
         # Unregister existing student
-        response = self.client.post(
-            "/activities/Chess Club/unregister?email=michael@mergington.edu"
+        response = await client.post(
+            CHESS_UNREGISTER, params={"email": MICHAEL}
         )
         assert response.status_code == 200
         
         data = response.json()
         assert "message" in data
-        assert "michael@mergington.edu" in data["message"]
-        assert "Chess Club" in data["message"]
+        assert MICHAEL in data["message"]
+        assert CHESS_CLUB in data["message"]
         
         # Verify participant was removed
-        updated_response = self.client.get("/activities")
-        updated_data = updated_response.json()
-        updated_chess_club = updated_data["Chess Club"]
+        updated_chess_club = activities[CHESS_CLUB]
         assert len(updated_chess_club["participants"]) == initial_count - 1
-        assert "michael@mergington.edu" not in updated_chess_club["participants"]
+        assert MICHAEL not in updated_chess_club["participants"]
     
-    def test_unregister_from_nonexistent_activity(self):
+    async def test_unregister_from_nonexistent_activity(self, client):
         """Test unregister from non-existent activity returns 404."""
-        response = self.client.post(
-            "/activities/Nonexistent Activity/unregister?email=student@mergington.edu"
+        response = await client.post(
+            "/activities/Nonexistent Activity/unregister", params={"email": "student@mergington.edu"}
         )
         assert response.status_code == 404
         
-        data = response.json()
-        assert data["detail"] == "Activity not found"
+        assert b'"detail":"Activity not found"' in response.content
     
-    def test_unregister_non_registered_student(self):
+    async def test_unregister_non_registered_student(self, client):
         """Test unregister non-registered student returns 400."""
-        response = self.client.post(
-            "/activities/Chess Club/unregister?email=notregistered@mergington.edu"
+        response = await client.post(
+            CHESS_UNREGISTER, params={"email": "notregistered@mergington.edu"}
         )
         assert response.status_code == 400
         
-        data = response.json()
-        assert data["detail"] == "Student is not registered for this activity"
+        assert b'"detail":"Student is not registered for this activity"' in response.content
     
-    def test_activity_data_integrity(self):
+    @pytest.mark.parametrize("activity_name", _ACTIVITY_NAMES)
+    async def test_activity_data_integrity(self, initial_activities_snapshot, activity_name):
         """Test that activity data maintains expected structure."""
-        response = self.client.get("/activities")
-        assert response.status_code == 200
+        activity_data = initial_activities_snapshot[activity_name]
+
+        # Check required fields
+        assert isinstance(activity_name, str)
+        assert len(activity_name) > 0
         
-        data = response.json()
+        assert "description" in activity_data
+        assert isinstance(activity_data["description"], str)
+        assert len(activity_data["description"]) > 0
+        
+        assert "schedule" in activity_data
+        assert isinstance(activity_data["schedule"], str)
+        assert len(activity_data["schedule"]) > 0
+        
+        assert "max_participants" in activity_data
+        assert isinstance(activity_data["max_participants"], int)
+        assert activity_data["max_participants"] > 0
+        
+        assert "participants" in activity_data
+        assert isinstance(activity_data["participants"], list)
         
-        for activity_name, activity_data in data.items():
-            # Check required fields
-            assert isinstance(activity_name, str)
-            assert len(activity_name) > 0
-            
-            assert "description" in activity_data
-            assert isinstance(activity_data["description"], str)
-            assert len(activity_data["description"]) > 0
-            
-            assert "schedule" in activity_data
-            assert isinstance(activity_data["schedule"], str)
-            assert len(activity_data["schedule"]) > 0
-            
-            assert "max_participants" in activity_data
-            assert isinstance(activity_data["max_participants"], int)
-            assert activity_data["max_participants"] > 0
-            
-            assert "participants" in activity_data
-            assert isinstance(activity_data["participants"], list)
-            
-            # Check that participants count doesn't exceed max
-            assert len(activity_data["participants"]) <= activity_data["max_participants"]
-            
-            # Check that all participants have valid email format
-            for participant in activity_data["participants"]:
-                assert isinstance(participant, str)
-                assert "@" in participant
-                assert participant.endswith("@mergington.edu")
+        # Check that participants count doesn't exceed max
+        assert len(activity_data["participants"]) <= activity_data["max_participants"]
+        
+        # Check that all participants have valid email format
+        invalid = [
+            participant for participant in activity_data["participants"]
+            if not (isinstance(participant, str) and participant.endswith("@mergington.edu"))
+        ]
+        assert not invalid, invalid
 
 
 class TestActivityBusinessLogic:
     """Test business logic and edge cases."""
     
-    def setup_method(self):
-        """Setup method run before each test."""
-        self.client = TestClient(app)
-    
-    def test_activity_capacity_limits(self):
+    @pytest.mark.parametrize("activity_name", _ACTIVITY_NAMES)
+    async def test_activity_capacity_limits(self, initial_activities_snapshot, activity_name):
         """Test that activities respect participant limits."""
-        response = self.client.get("/activities")
-        data = response.json()
+        activity_data = initial_activities_snapshot[activity_name]
+        current_participants = len(activity_data["participants"])
+        max_participants = activity_data["max_participants"]
+        spots_available = max_participants - current_participants
         
-        for activity_name, activity_data in data.items():
-            current_participants = len(activity_data["participants"])
-            max_participants = activity_data["max_participants"]
-            spots_available = max_participants - current_participants
-            
-            # Verify spots calculation is correct
-            assert spots_available >= 0
-            assert current_participants <= max_participants
-    
-    def test_signup_and_unregister_workflow(self):
+        # Verify spots calculation is correct
+        assert spots_available >= 0
+        assert current_participants <= max_participants
+
+    async def test_signup_and_unregister_workflow(self, client, initial_activities_snapshot):
         """Test complete signup and unregister workflow."""
         test_email = "workflow@mergington.edu"
-        activity_name = "Programming Class"
+        activity_name = PROGRAMMING_CLASS
         
         # 1. Get initial state
-        initial_response = self.client.get("/activities")
-        initial_data = initial_response.json()
-        initial_participants = initial_data[activity_name]["participants"].copy()
+        initial_participants = initial_activities_snapshot[activity_name]["participants"]
         
         # 2. Sign up
-        signup_response = self.client.post(
-            f"/activities/{activity_name}/signup?email={test_email}"
+        signup_response = await client.post(
+            PROGRAMMING_SIGNUP, params={"email": test_email}
         )
         assert signup_response.status_code == 200
         
         # 3. Verify signup
-        after_signup_response = self.client.get("/activities")
-        after_signup_data = after_signup_response.json()
-        assert test_email in after_signup_data[activity_name]["participants"]
-        assert len(after_signup_data[activity_name]["participants"]) == len(initial_participants) + 1
+        assert test_email in activities[activity_name]["participants"]
+        assert len(activities[activity_name]["participants"]) == len(initial_participants) + 1
         
         # 4. Unregister
-        unregister_response = self.client.post(
-            f"/activities/{activity_name}/unregister?email={test_email}"
+        unregister_response = await client.post(
+            PROGRAMMING_UNREGISTER, params={"email": test_email}
         )
         assert unregister_response.status_code == 200
         
         # 5. Verify unregister
-        after_unregister_response = self.client.get("/activities")
-        after_unregister_data = after_unregister_response.json()
-        assert test_email not in after_unregister_data[activity_name]["participants"]
-        assert after_unregister_data[activity_name]["participants"] == initial_participants
+        assert test_email not in activities[activity_name]["participants"]
+        assert activities[activity_name]["participants"] == initial_participants
+    
+    async def test_batch_signup_and_unregister_workflow(self, client, initial_activities_snapshot):
+        """Test signup and unregister workflow through the batch endpoint."""
+        test_email = "workflow@mergington.edu"
+        activity_name = PROGRAMMING_CLASS
+        initial_participants = initial_activities_snapshot[activity_name]["participants"]
+        
+        response = await client.post("/activities/batch", json={"ops": [
+            {"path": f"/activities/{activity_name}/signup", "email": test_email},
+            {"path": f"/activities/{activity_name}/unregister", "email": test_email},
+        ]})
+        assert response.status_code == 200
+        
+        # Results come back in request order
+        data = response.json()
+        assert [result["status_code"] for result in data] == [200, 200]
+        assert data[0]["message"] == f"Signed up {test_email} for {activity_name}"
+        assert data[1]["message"] == f"Unregistered {test_email} from {activity_name}"
+        assert activities[activity_name]["participants"] == initial_participants
+    
+    async def test_batch_reports_errors_per_operation(self, client):
+        """Test that a failing batch operation does not stop the others."""
+        response = await client.post("/activities/batch", json={"ops": [
+            {"path": "/activities/Nonexistent Activity/signup", "email": "student@mergington.edu"},
+            {"path": f"/activities/{CHESS_CLUB}/signup", "email": MICHAEL},
+            {"path": f"/activities/{CHESS_CLUB}/delete", "email": MICHAEL},
+            {"path": f"/activities/{CHESS_CLUB}/signup", "email": "batch@mergington.edu"},
+        ]})
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert [result["status_code"] for result in data] == [404, 400, 404, 200]
+        assert data[0]["detail"] == "Activity not found"
+        assert data[1]["detail"] == "Student already signed up"
+        assert data[2]["detail"] == "Operation not found"
+        assert "batch@mergington.edu" in activities[CHESS_CLUB]["participants"]
     
-    def test_special_characters_in_activity_names(self):
+    async def test_special_characters_in_activity_names(self, client):
         """Test handling of special characters in activity names."""
         # Test with URL encoding
-        response = self.client.post(
+        response = await client.post(
             "/activities/Chess%20Club/signup?email=special@mergington.edu"
         )
         # Should work with URL encoded space
         assert response.status_code in [200, 400]  # 400 if already registered
     
-    def test_email_validation_patterns(self):
+    @pytest.mark.parametrize("email", [
+        "valid@mergington.edu",
+        "another.student@mergington.edu",
+        "student+tag@mergington.edu",
+    ])
+    async def test_email_validation_patterns(self, client, email):
         """Test various email patterns."""
-        test_cases = [
-            ("valid@mergington.edu", True),
-            ("another.student@mergington.edu", True),
-            ("student+tag@mergington.edu", True),
-        ]
-        
-        for email, should_work in test_cases:
-            response = self.client.post(
-                f"/activities/Art Club/signup?email={email}"
-            )
-            if should_work:
-                assert response.status_code in [200, 400]  # 400 if already registered
-            # Note: The current API doesn't validate email format,
-            # but this test structure allows for future email validation
\ No newline at end of file
+        response = await client.post(
+            "/activities/Art Club/signup", params={"email": email}
+        )
+        assert response.status_code == 200
+        # Note: The current API doesn't validate email format,
+        # but this test structure allows for future email validation